@@ -1,61 +1,79 @@
-# Consts for DrillingRobot actions
-TURN_RIGHT = "TURN_RIGHT"
-TURN_LEFT = "TURN_LEFT"
-DRILL = "DRILL"
+import sys
 
-# Mapping to show orientation in a readable format
-ORIENTATION_NAMES = {
-    0: 'North (0)', 1: 'Northeast (1)', 2: 'East (2)', 3: 'Southeast (3)',
-    4: 'South (4)', 5: 'Southwest (5)', 6: 'West (6)', 7: 'Northwest (7)'
-}
+# Consts for DrillingRobot actions (small ints: cheap to compare in the search hot path)
+TURN_LEFT = 0
+TURN_RIGHT = 1
+DRILL = 2
+
+# Mapping to show actions in a readable format (indexed by action)
+ACTION_NAMES = ('TURN_LEFT', 'TURN_RIGHT', 'DRILL')
+
+# Mapping to show orientation in a readable format (indexed by orientation)
+ORIENTATION_NAMES = (
+    'North (0)', 'Northeast (1)', 'East (2)', 'Southeast (3)',
+    'South (4)', 'Southwest (5)', 'West (6)', 'Northwest (7)'
+)
 
 def print_path_trace(problem, solution_node, algorithm_name, is_blind_search):
     """
     Prints the execution trace of the found solution,
     following the format requested in Section 4.2 of the statement.
+
+    The whole trace is built as a list of lines and written with a single
+    `sys.stdout.write` call.
     """
-    print("=" * 60)
-    print(f"ALGORITHM: {algorithm_name}")
-    print("=" * 60)
+    lines = [
+        "=" * 60,
+        f"ALGORITHM: {algorithm_name}",
+        "=" * 60,
+    ]
 
     if not solution_node:
-        print("WARNING! No solution found. Showing trace up to the last examined node.")
-        print("End of execution without solution.")
+        lines.append("WARNING! No solution found. Showing trace up to the last examined node.")
+        lines.append("End of execution without solution.")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     # 1. Rebuild the path from the final node back to the root (initial node)
     path = solution_node.path()
 
-    # 2. Print the execution trace
-    print("--- EXECUTION TRACE (Solution) ---")
-    
+    # 2. Build the execution trace
+    lines.append("--- EXECUTION TRACE (Solution) ---")
+
     # The first node is the root node (no previous operator)
     root_node = path[0]
-    x, y, o = root_node.state
-    orientation = ORIENTATION_NAMES.get(o, 'N/A')
-    
+    x, y, o = problem.decode_state(root_node.state)
+    orientation = ORIENTATION_NAMES[o]
+
     # Node 0: (d, g(n), op, S) or (d, g(n), op, h(n), S)
     if is_blind_search:
-        print(f"Node 0 (starting node): (depth:{root_node.depth}, total cost:{root_node.path_cost}, action:None, State: x={x}, y={y}, o={orientation})")
+        lines.append(f"Node 0 (starting node): (depth:{root_node.depth}, total cost:{root_node.path_cost}, action:None, State: x={x}, y={y}, o={orientation})")
     else: # A*
-        h_val = problem.h(root_node) # Calculate h(n) for the root
-        print(f"Node 0 (starting node): (depth:{root_node.depth}, total cost:{root_node.path_cost}, action:None, h(n):{h_val}, State: x={x}, y={y}, o={orientation})")
+        # A* caches h(n) on every node it pushes (root included), so reuse it
+        # instead of recomputing (possibly with a different heuristic)
+        h_val = root_node.h
+        lines.append(f"Node 0 (starting node): (depth:{root_node.depth}, total cost:{root_node.path_cost}, action:None, h(n):{h_val}, State: x={x}, y={y}, o={orientation})")
 
+    # Remaining nodes (from 1 to N): pull their fields into flat lists once,
+    # then fill a positional line template chosen once for the whole path.
+    # A* caches h(n) on every node it pushes, so it is read from the nodes
+    nodes = path[1:]
+    depths = [node.depth for node in nodes]
+    costs = [node.path_cost for node in nodes]
+    operators = [ACTION_NAMES[node.action] for node in nodes]
+    states = [problem.decode_state(node.state) for node in nodes]
+    if is_blind_search:
+        node_fmt = "Node {0}: (depth:{1}, total cost:{2}, action:{3}, State: x={5}, y={6}, o={7})"
+        h_vals = [None] * len(nodes)
+    else: # A*
+        node_fmt = "Node {0}: (depth:{1}, total cost:{2}, action:{3}, h(n):{4}, State: x={5}, y={6}, o={7})"
+        h_vals = [node.h for node in nodes]
 
-    # Print the remaining nodes (from 1 to N)
-    for i in range(1, len(path)):
-        node = path[i]
-        operator = path[i].action
-
-        x, y, o = node.state
-        orientation = ORIENTATION_NAMES.get(o, 'N/A')
-
-        print(f"Operator: {operator}")
+    for i, (depth, cost, operator, h_val, (x, y, o)) in enumerate(
+        zip(depths, costs, operators, h_vals, states), start=1
+    ):
+        lines.append(f"Operator: {operator}")
+        # Successor orientations are always wrapped into 0..7
+        lines.append(node_fmt.format(i, depth, cost, operator, h_val, x, y, ORIENTATION_NAMES[o]))
 
-        # Print Node i
-        if is_blind_search:
-            print(f"Node {i}: (depth:{node.depth}, total cost:{node.path_cost}, action:{operator}, State: x={x}, y={y}, o={orientation})")
-        else: # A*            
-            # We use the node cost as h(n) to avoid recalculation and assume that h is stored in the node
-            h_val = node.h
-            print(f"Node {i}: (depth:{node.depth}, total cost:{node.path_cost}, action:{operator}, h(n):{h_val}, State: x={x}, y={y}, o={orientation})")
\ No newline at end of file
+    sys.stdout.write("\n".join(lines) + "\n")
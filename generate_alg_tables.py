@@ -25,25 +25,38 @@ Each table: rows = algorithms (bfs, dfs, astar), columns = d, g, #E, #F
 """
 
 import os
+import re
 import glob
 import argparse
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
 RESULTS_DIR = "results"
 TABLES_DIR = "tables"
 PATTERN = os.path.join(RESULTS_DIR, "results_*x*.csv")
+SIZE_RE = re.compile(r"(\d+x\d+)")  # Map size in a results file name, e.g. "3x3"
 
 METRICS = ["d", "g", "#E", "#F"]
+
+# Columns every results CSV must provide
+REQUIRED_COLUMNS = frozenset({"map", "algorithm", "heuristic", *METRICS})
+
 ALG_ORDER = ["bfs", "dfs", "astar"]  # Desired output order
 
+# Types of the string columns of the results CSVs (written by main.py); the
+# repeated ones are categorical. Metric types are left to the parser so a
+# malformed cell does not make the whole file unreadable.
+DTYPES = {
+    "map": "string",
+    "algorithm": "category",
+    "heuristic": "category",
+}
+
 
 def extract_size_from_name(filename: str) -> str:
     """Extracts the grid size (e.g., '3x3', '5x5', etc.) from the filename."""
-    name = os.path.basename(filename)
-    for part in name.split("_"):
-        if "x" in part:
-            return part.replace(".csv", "").replace("N", "")
-    return "unknown"
+    m = SIZE_RE.search(os.path.basename(filename))
+    return m.group(1) if m else "unknown"
 
 
 def compute_table_for_size(df: pd.DataFrame, chosen_heur: str) -> pd.DataFrame:
@@ -58,46 +71,32 @@ def compute_table_for_size(df: pd.DataFrame, chosen_heur: str) -> pd.DataFrame:
         A DataFrame with average values for each algorithm:
         columns = METRICS, index = algorithm.
     """
-    df.columns = [c.strip() for c in df.columns]
+    df.columns = df.columns.str.strip()
 
-    required = {"map", "algorithm", "heuristic"} | set(METRICS)
-    if not required.issubset(df.columns):
+    if not REQUIRED_COLUMNS.issubset(df.columns):
         # Return empty placeholder if columns are missing
         return pd.DataFrame(columns=METRICS, index=ALG_ORDER)
 
-    # Convert metrics to numeric values (ignore errors)
-    df_num = df.copy()
-    for m in METRICS:
-        df_num[m] = pd.to_numeric(df_num[m], errors="coerce")
-
-    # Filter per algorithm
-    bfs_rows = df_num[df_num["algorithm"] == "bfs"]
-    dfs_rows = df_num[df_num["algorithm"] == "dfs"]
-    astar_rows = df_num[
-        (df_num["algorithm"] == "astar") & (df_num["heuristic"] == chosen_heur)
-    ]
-
-    # Group and compute mean metrics
-    parts = []
-    if not bfs_rows.empty:
-        parts.append(bfs_rows.groupby("algorithm")[METRICS].mean(numeric_only=True))
-    if not dfs_rows.empty:
-        parts.append(dfs_rows.groupby("algorithm")[METRICS].mean(numeric_only=True))
-    if not astar_rows.empty:
-        parts.append(astar_rows.groupby("algorithm")[METRICS].mean(numeric_only=True))
-
-    if parts:
-        table = pd.concat(parts, axis=0)
-    else:
-        table = pd.DataFrame(columns=METRICS)
+    # Keep only the columns the table needs, with metrics as numeric values
+    # (ignore errors); this builds a new frame, so no defensive copy is needed.
+    # Clean metric columns are already parsed as numbers; a column holding a
+    # malformed cell comes in as object and is coerced (bad cells -> NaN)
+    df_num = df[["algorithm", "heuristic", *METRICS]]
+    if not all(is_numeric_dtype(df_num[m]) for m in METRICS):
+        df_num = df_num.assign(**{m: pd.to_numeric(df_num[m], errors="coerce") for m in METRICS})
+
+    # Keep BFS/DFS rows and the A* rows for the chosen heuristic, then
+    # aggregate everything with a single groupby
+    alg = df_num["algorithm"]
+    mask = alg.isin(["bfs", "dfs"]) | ((alg == "astar") & (df_num["heuristic"] == chosen_heur))
+    table = df_num.loc[mask].groupby("algorithm", sort=False, observed=True)[METRICS].mean(numeric_only=True)
 
     # Order rows by ALG_ORDER; ignore missing ones
     if not table.empty:
-        table = table[~table.index.duplicated(keep="first")]
-        ordered = [a for a in ALG_ORDER if a in table.index]
-        remaining = sorted([a for a in table.index if a not in ALG_ORDER])
-        table = table.loc[ordered + remaining]
+        table = table.loc[[a for a in ALG_ORDER if a in table.index]]
         table = table.round(3)
+    else:
+        table = pd.DataFrame(columns=METRICS)
 
     return table
 
@@ -126,7 +125,12 @@ def main():
 
     for csv_path in files:
         try:
-            df = pd.read_csv(csv_path)
+            df = pd.read_csv(
+                csv_path,
+                usecols=lambda c: c.strip() in REQUIRED_COLUMNS,
+                dtype=DTYPES,
+                engine="c",
+            )
         except Exception as e:
             print(f"[WARN] Could not read {csv_path}: {e}")
             continue
@@ -16,69 +16,127 @@ Output (saved to ./tables):
   tables/astar_table_7x7.csv
   tables/astar_table_9x9.csv
   tables/astar_table_all.csv   <- aggregated table including all map sizes
+
+Usage:
+  python generate_astar_tables.py
+  # read the results files with 4 worker processes
+  python generate_astar_tables.py --jobs 4
 """
 
 import os
+import re
 import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 
 RESULTS_DIR = "results"
 TABLES_DIR = "tables"
 PATTERN = os.path.join(RESULTS_DIR, "results_*x*.csv")
+SIZE_RE = re.compile(r"(\d+x\d+)")  # Map size in a results file name, e.g. "3x3"
 
 METRICS = ["d", "g", "#E", "#F"]
 
+# Columns every results CSV must provide
+REQUIRED_COLUMNS = frozenset({"map", "algorithm", "heuristic", *METRICS})
+
 # Preferred heuristic order for display
 HEUR_ORDER = ["h", "h_chebyshev", "h_euclidean", "h_minhardness", "h_combined"]
+HEUR_RANK = {h: i for i, h in enumerate(HEUR_ORDER)}
+
+# Types of the string columns of the results CSVs (written by main.py); the
+# repeated ones are categorical. Metric types are left to the parser so a
+# malformed cell does not make the whole file unreadable.
+DTYPES = {
+    "map": "string",
+    "algorithm": "category",
+    "heuristic": "category",
+}
 
 
 def order_heuristics(index):
     """Return a sorted index prioritizing known heuristics from HEUR_ORDER."""
-    known = [h for h in HEUR_ORDER if h in index]
-    remaining = sorted([h for h in index if h not in HEUR_ORDER])
-    return known + remaining
+    return sorted(index, key=lambda h: (HEUR_RANK.get(h, len(HEUR_ORDER)), h))
 
 
 def extract_size_from_name(filename: str) -> str:
     """Extract the map size (e.g., '3x3', '5x5', etc.) from the filename."""
-    name = os.path.basename(filename)
-    for part in name.split("_"):
-        if "x" in part:
-            return part.replace(".csv", "").replace("N", "")
-    return "unknown"
+    m = SIZE_RE.search(os.path.basename(filename))
+    return m.group(1) if m else "unknown"
 
 
-def compute_table_a_star(df: pd.DataFrame) -> pd.DataFrame:
+def compute_tables_a_star(astar: pd.DataFrame):
     """
-    Filter A* results and compute mean metrics grouped by heuristic.
+    Compute mean metrics per heuristic, for every map size and overall.
 
     Args:
-        df: Input DataFrame loaded from a results CSV file.
+        astar: A* rows of all results files, with columns
+               "size", "heuristic" (both categorical) and METRICS.
 
     Returns:
-        A DataFrame containing the average metrics (d, g, #E, #F)
-        for each heuristic used with A*.
+        (per_size, general): `per_size` is indexed by (size, heuristic) and
+        `general` by heuristic; both hold the average metrics (d, g, #E, #F).
     """
-    a_star = df[df["algorithm"] == "astar"].copy()
-    if a_star.empty:
-        return pd.DataFrame(columns=METRICS)
-
-    # Ensure metrics are numeric
-    for m in METRICS:
-        a_star[m] = pd.to_numeric(a_star[m], errors="coerce")
-
-    grouped = (
-        a_star.groupby("heuristic", dropna=False)[METRICS]
+    per_size = (
+        astar.groupby(["size", "heuristic"], observed=True, dropna=False)[METRICS]
         .mean(numeric_only=True)
         .round(3)
     )
+    general = (
+        astar.groupby("heuristic", observed=True, dropna=False)[METRICS]
+        .mean(numeric_only=True)
+        .round(3)
+    )
+    return per_size, general
+
+
+def load_astar_rows(csv_path: str):
+    """
+    Read one results file and keep its A* rows.
+
+    Args:
+        csv_path: Path to a results CSV file.
 
-    if not grouped.empty:
-        grouped = grouped.loc[order_heuristics(grouped.index)]
-    return grouped
+    Returns:
+        (size, astar, warning): the map size taken from the file name, the A*
+        rows (columns "heuristic" and METRICS, tagged with "size"), and a
+        warning message; `astar` is None when the file could not be used.
+    """
+    size = extract_size_from_name(csv_path)
+    try:
+        df = pd.read_csv(
+            csv_path,
+            usecols=lambda c: c.strip() in REQUIRED_COLUMNS,
+            dtype=DTYPES,
+            engine="c",
+        )
+    except Exception as e:
+        return size, None, f"[WARN] Could not read {csv_path}: {e}"
+
+    df.columns = df.columns.str.strip()
+    if not REQUIRED_COLUMNS.issubset(df.columns):
+        return size, None, f"[WARN] {csv_path} is missing required columns."
+
+    # Keep only the A* rows and the columns the tables need, tagged by size
+    astar = df.loc[df["algorithm"].values == "astar", ["heuristic", *METRICS]]
+    return size, astar.assign(size=size), None
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Generate A* summary tables (mean metrics per heuristic)."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to read the results files (default: 1).",
+    )
+    args = parser.parse_args()
+
     os.makedirs(TABLES_DIR, exist_ok=True)
     files = sorted(glob.glob(PATTERN))
 
@@ -86,35 +144,55 @@ def main():
         print(f"No result files found matching pattern: {PATTERN}")
         return
 
-    all_astar_rows = []
+    # Results files are independent: read them in parallel if requested
+    jobs = min(args.jobs, len(files))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            loaded = list(executor.map(load_astar_rows, files))
+    else:
+        loaded = [load_astar_rows(csv_path) for csv_path in files]
 
-    for csv_path in files:
-        try:
-            df = pd.read_csv(csv_path)
-        except Exception as e:
-            print(f"[WARN] Could not read {csv_path}: {e}")
-            continue
+    sizes = []
+    astar_frames = []
 
-        df.columns = [c.strip() for c in df.columns]
-        required = {"map", "algorithm", "heuristic"} | set(METRICS)
-        if not required.issubset(df.columns):
-            print(f"[WARN] {csv_path} is missing required columns.")
+    for size, astar, warning in loaded:
+        if astar is None:
+            print(warning)
             continue
+        astar_frames.append(astar)
+        if size not in sizes:
+            sizes.append(size)
 
-        # Collect A* rows for the global table
-        all_astar_rows.append(df[df["algorithm"] == "astar"].copy())
+    if not sizes:
+        print("No CSV files were successfully read; no tables generated.")
+        return
 
-        # Compute table for this map size
-        grouped = compute_table_a_star(df)
-        size = extract_size_from_name(csv_path)
+    # One concatenated frame and categorical group keys (categories in display
+    # order, so the groupby output is already sorted). Clean metric columns
+    # are already numeric; one with a malformed cell in any file comes in as
+    # object and is coerced (bad cells -> NaN)
+    big_df = pd.concat(astar_frames, ignore_index=True)
+    if not all(is_numeric_dtype(big_df[m]) for m in METRICS):
+        big_df[METRICS] = big_df[METRICS].apply(pd.to_numeric, errors="coerce")
+    big_df["size"] = pd.Categorical(big_df["size"], categories=sizes)
+    heuristics = big_df["heuristic"].dropna().unique()
+    big_df["heuristic"] = pd.Categorical(big_df["heuristic"], categories=order_heuristics(heuristics))
+
+    per_size, general_table = compute_tables_a_star(big_df)
+
+    # Table for each map size
+    present = set(per_size.index.get_level_values("size"))
+    for size in sizes:
+        if size in present:
+            grouped = per_size.xs(size, level="size")
+        else:
+            grouped = pd.DataFrame(columns=METRICS)
         out_path = os.path.join(TABLES_DIR, f"astar_table_{size}.csv")
         grouped.to_csv(out_path, index=True)
         print(f"Generated: {out_path}")
 
     # --- Global summary table (all map sizes combined) ---
-    if all_astar_rows:
-        big_df = pd.concat(all_astar_rows, ignore_index=True)
-        general_table = compute_table_a_star(big_df)
+    if not big_df.empty:
         out_all = os.path.join(TABLES_DIR, "astar_table_all.csv")
         general_table.to_csv(out_all, index=True)
         print(f"Generated global summary: {out_all}")
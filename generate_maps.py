@@ -1,31 +1,45 @@
 #!/usr/bin/env python3
 import argparse
-import random
-import re
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-FILENAME_RE = re.compile(r"^map(\d+)\.txt$")
+import numpy as np
 
-def generate_map(n: int, hmin: int, hmax: int) -> list[list[int]]:
+# Decimal text of small non-negative integers, indexed by value (hardness lookup)
+INT_STR = np.array([str(i) for i in range(256)], dtype=object)
+
+def generate_map(n: int, hmin: int, hmax: int, rng: np.random.Generator) -> np.ndarray:
     """Generate an n x n grid with integer hardness values in [hmin, hmax]."""
-    return [[random.randint(hmin, hmax) for _ in range(n)] for _ in range(n)]
+    return rng.integers(hmin, hmax + 1, size=(n, n), dtype=np.int32)
+
+def write_map_file(path: Path, grid: np.ndarray, start: tuple[int,int,int], goal: tuple[int,int,int]) -> None:
+    """
+    Write the map file in the required format for the DrillingRobot problem.
 
-def write_map_file(path: Path, grid: list[list[int]], start: tuple[int,int,int], goal: tuple[int,int,int]) -> None:
-    """Write the map file in the required format for the DrillingRobot problem."""
+    The whole file is built in memory and written with a single call.
+    """
     n = len(grid)
-    with path.open("w", encoding="utf-8") as f:
+    if grid.size and grid.min() >= 0 and grid.max() < len(INT_STR):
+        # Usual case: every value is a table lookup, no per-value formatting
+        rows = [" ".join(row) for row in INT_STR[grid].tolist()]
+    else:
+        row_fmt = " ".join(["%d"] * n)
+        rows = [row_fmt % tuple(row) for row in grid.tolist()]
+    sx, sy, so = start
+    gx, gy, go = goal
+    lines = [
         # 1) Map dimensions
-        f.write(f"{n} {n}\n")
+        f"{n} {n}",
         # 2) Terrain hardness grid
-        for row in grid:
-            f.write(" ".join(str(v) for v in row) + "\n")
+        *rows,
         # 3) Initial position and orientation (x y o)
-        sx, sy, so = start
-        f.write(f"{sx} {sy} {so}\n")
+        f"{sx} {sy} {so}",
         # 4) Goal position and orientation (x y o)
-        gx, gy, go = goal
-        f.write(f"{gx} {gy} {go}\n")
+        f"{gx} {gy} {go}",
+    ]
+    path.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
 
 def find_next_id(subdir: Path) -> int:
     """
@@ -35,18 +49,36 @@ def find_next_id(subdir: Path) -> int:
     max_id = 0
     if not subdir.exists():
         return 1
-    for p in subdir.iterdir():
-        if p.is_file():
-            m = FILENAME_RE.match(p.name)
-            if m:
+    # scandir yields entry names without a stat() call per file
+    with os.scandir(subdir) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("map") and name.endswith(".txt"):
                 try:
-                    idx = int(m.group(1))
-                    if idx > max_id:
-                        max_id = idx
+                    idx = int(name[3:-4])
                 except ValueError:
                     # Ignore malformed names like mapXYZ.txt
-                    pass
-    return max_id + 1 if max_id >= 1 else 1
+                    continue
+                if idx > max_id:
+                    max_id = idx
+    return max_id + 1
+
+def make_map(task: tuple) -> Path:
+    """
+    Generate and write one map.
+
+    `task` is (path, n, hmin, hmax, goal_orientation, seed_seq); the grid and,
+    if `goal_orientation` is None, the goal orientation are drawn from a
+    generator seeded with `seed_seq`. The start is fixed at (0, 0, North=0)
+    per spec and the goal cell is (n-1, n-1). Returns `path`.
+    """
+    path, n, hmin, hmax, goal_orientation, seed_seq = task
+    rng = np.random.default_rng(seed_seq)
+    grid = generate_map(n, hmin, hmax, rng)
+    if goal_orientation is None:
+        goal_orientation = int(rng.integers(0, 9))
+    write_map_file(path, grid, (0, 0, 0), (n - 1, n - 1, goal_orientation))
+    return path
 
 def main():
     parser = argparse.ArgumentParser(
@@ -98,6 +130,13 @@ def main():
         default=None,
         help="Random seed for reproducibility (optional).",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to generate the maps. Default: 1",
+    )
     args = parser.parse_args()
 
     # Validations
@@ -107,43 +146,45 @@ def main():
         if n <= 0:
             parser.error("All sizes must be positive integers")
 
-    # Seed
-    if args.seed is not None:
-        random.seed(args.seed)
+    # One independent random stream per map, spawned from the seed: the maps
+    # are reproducible whatever the number of worker processes
+    seed_seqs = iter(np.random.SeedSequence(args.seed).spawn(len(args.sizes) * args.per_size))
 
     # Ensure base dir
     args.outdir.mkdir(parents=True, exist_ok=True)
 
-    # Generate per size
+    # Plan every map on the driver (file IDs included), then generate them
+    tasks = []
     for n in args.sizes:
         subdir = args.outdir / f"N{n}x{n}"
         subdir.mkdir(parents=True, exist_ok=True)
 
         # Determine starting id based on existing map{id}.txt files
-        start_id = find_next_id(subdir)
-
-        # Fixed start (0,0,North=0) per spec
-        start_state = (0, 0, 0)
-
-        # Generate maps
-        for k in range(args.per_size):
-            grid = generate_map(n, args.hardness_min, args.hardness_max)
-            goal_orientation = args.goal_orientation if args.goal_orientation is not None else random.randint(0, 8)
-            goal_state = (n - 1, n - 1, goal_orientation)
+        file_id = find_next_id(subdir)
 
-            file_id = start_id + k
+        for _ in range(args.per_size):
             path = subdir / f"map{file_id}.txt"
 
             # Safety: never overwrite unexpectedly
-            if path.exists():
-                # Extremely unlikely if start_id was computed correctly, but safe-guard anyway
-                # Skip to next available id
-                while path.exists():
-                    file_id += 1
-                    path = subdir / f"map{file_id}.txt"
-
-            write_map_file(path, grid, start_state, goal_state)
-            print(f"Generated: {path}")
+            # Extremely unlikely if the start id was computed correctly, but
+            # safe-guard anyway: skip to next available id
+            while path.exists():
+                file_id += 1
+                path = subdir / f"map{file_id}.txt"
+
+            tasks.append((path, n, args.hardness_min, args.hardness_max, args.goal_orientation, next(seed_seqs)))
+            file_id += 1
+
+    # Maps are independent: generate them in parallel if requested
+    jobs = min(args.jobs, len(tasks))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            paths = list(executor.map(make_map, tasks))
+    else:
+        paths = [make_map(task) for task in tasks]
+
+    for path in paths:
+        print(f"Generated: {path}")
 
 if __name__ == "__main__":
     main()
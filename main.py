@@ -1,12 +1,76 @@
 import argparse
 import csv
+import sys
 from pathlib import Path
-from DrillingRobot import DrillingRobot
-from drilling_utils import *
-from search import breadth_first_graph_search, depth_first_graph_search, astar_search
 
 
-if __name__ == '__main__':
+CSV_FIELDS = ['map', 'algorithm', 'heuristic', 'd', 'g', '#E', '#F']
+INFORMED_ALGORITHMS = ('astar', 'idastar', 'bidastar')
+
+
+def run_search(problem, algorithm_choice, heuristic_choice):
+    """Run one algorithm on an already-loaded problem.
+
+    Returns (solution_node, explored, frontier, algorithm_name, is_blind).
+    """
+    from search import breadth_first_graph_search, depth_first_graph_search, astar_search, idastar_search, \
+        bidirectional_astar_search
+
+    solution_node = None
+    algorithm_name = ""
+    is_blind = False
+
+    if algorithm_choice == 'bfs':
+        solution_node, gen, exp, edges, order, frontier = breadth_first_graph_search(problem)
+        algorithm_name = "Breadth-First Search (BFS)"
+        is_blind = True
+
+    elif algorithm_choice == 'dfs':
+        solution_node, gen, exp, edges, order, frontier = depth_first_graph_search(problem)
+        algorithm_name = "Depth-First Search (DFS)"
+        is_blind = True
+
+    elif algorithm_choice in INFORMED_ALGORITHMS:
+        search_func = {
+            'astar': astar_search,
+            'idastar': idastar_search,
+            'bidastar': bidirectional_astar_search,
+        }[algorithm_choice]
+
+        if heuristic_choice == "default":
+            solution_node, gen, exp, edges, order, frontier = search_func(problem)
+        elif hasattr(problem, heuristic_choice):
+            heuristic_func = getattr(problem, heuristic_choice)
+            solution_node, gen, exp, edges, order, frontier = search_func(problem, h=heuristic_func)
+        else:
+            print(f"Warning: Heuristic '{heuristic_choice}' not found. Using default.")
+            solution_node, gen, exp, edges, order, frontier = search_func(problem)
+
+        if algorithm_choice == 'astar':
+            algorithm_name = f"A* Search (heuristic: {heuristic_choice})"
+        elif algorithm_choice == 'idastar':
+            algorithm_name = f"IDA* Search (heuristic: {heuristic_choice})"
+        else:
+            algorithm_name = f"Bidirectional A* Search (heuristic: {heuristic_choice})"
+        is_blind = False
+
+    return solution_node, exp, frontier, algorithm_name, is_blind
+
+
+def result_row(map_path, algorithm_choice, heuristic_choice, solution_node, exp, frontier):
+    """Build the CSV row (see CSV_FIELDS) for one search run."""
+    return {
+        'map': map_path,
+        'algorithm': algorithm_choice,
+        'heuristic': heuristic_choice if algorithm_choice in INFORMED_ALGORITHMS else 'N/A',
+        'd': getattr(solution_node, "depth", None),
+        'g': getattr(solution_node, "path_cost", None),
+        '#E': len(exp),
+        '#F': len(frontier),
+    }
+
+
+def main():
     # -------------------------------
     # 1. Parse command-line arguments
     # -------------------------------
@@ -21,15 +85,15 @@ if __name__ == '__main__':
     parser.add_argument(
         "--heuristic",
         type=str,
-        default="default",
-        help="Heuristic function to use with A* (optional)."
+        default="h_combined",
+        help="Heuristic function to use with A*/IDA*/bidirectional A* (optional). Default: h_combined"
     )
     parser.add_argument(
         "-a", "--algorithm",
         type=str,
         required=True,
-        choices=['bfs', 'dfs', 'astar'],
-        help="The search algorithm to run (bfs, dfs, or astar)."
+        choices=['bfs', 'dfs', 'astar', 'idastar', 'bidastar'],
+        help="The search algorithm to run (bfs, dfs, astar, idastar, or bidastar)."
     )
     parser.add_argument(
         "-o", "--output",
@@ -40,6 +104,10 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
 
+    # Heavier imports (NumPy via DrillingRobot) only once the arguments are valid
+    from DrillingRobot import DrillingRobot
+    from drilling_utils import print_path_trace
+
     map_path = args.map_path
     heuristic_choice = args.heuristic.lower()
     algorithm_choice = args.algorithm.lower()
@@ -52,53 +120,25 @@ if __name__ == '__main__':
         problem = DrillingRobot(map_path)
     except FileNotFoundError:
         print(f"ERROR: Map file '{map_path}' not found. Please check the path.")
-        exit(1)
+        sys.exit(1)
     except Exception as e:
         print(f"An error occurred while loading the map: {e}")
-        exit(1)
+        sys.exit(1)
 
     # -------------------------------
     # 3. Run the selected algorithm
     # -------------------------------
-    solution_node = None
-    algorithm_name = ""
-    is_blind = False
-
-    if algorithm_choice == 'bfs':
-        solution_node, gen, exp, edges, order, frontier = breadth_first_graph_search(problem)
-        algorithm_name = "Breadth-First Search (BFS)"
-        is_blind = True
-
-    elif algorithm_choice == 'dfs':
-        solution_node, gen, exp, edges, order, frontier = depth_first_graph_search(problem)
-        algorithm_name = "Depth-First Search (DFS)"
-        is_blind = True
-
-    elif algorithm_choice == 'astar':
-        if heuristic_choice == "default":
-            solution_node, gen, exp, edges, order, frontier = astar_search(problem)
-        elif hasattr(problem, heuristic_choice):
-            heuristic_func = getattr(problem, heuristic_choice)
-            solution_node, gen, exp, edges, order, frontier = astar_search(problem, h=heuristic_func)
-        else:
-            print(f"Warning: Heuristic '{heuristic_choice}' not found. Using default.")
-            solution_node, gen, exp, edges, order, frontier = astar_search(problem)
-        
-        algorithm_name = f"A* Search (heuristic: {heuristic_choice})"
-        is_blind = False
+    solution_node, exp, frontier, algorithm_name, is_blind = run_search(problem, algorithm_choice, heuristic_choice)
 
     # -------------------------------
     # 4. Print performance metrics
     # -------------------------------
     print_path_trace(problem, solution_node, algorithm_name, is_blind)
     
-    d = getattr(solution_node, "depth", None)
-    g = getattr(solution_node, "path_cost", None)
-    explored = len(exp)
-    f = len(frontier)
+    row = result_row(map_path, algorithm_choice, heuristic_choice, solution_node, exp, frontier)
 
-    print(f"\nTotal number of items in explored list: {explored}")
-    print(f"Total number of items in frontier: {f}")
+    print(f"\nTotal number of items in explored list: {row['#E']}")
+    print(f"Total number of items in frontier: {row['#F']}")
 
     # -------------------------------
     # 5. Save results to CSV (optional)
@@ -108,22 +148,16 @@ if __name__ == '__main__':
             output_file = Path(output_path)
             write_header = not output_file.exists()
 
-            row = {
-                'map': map_path,
-                'algorithm': algorithm_choice,
-                'heuristic': heuristic_choice if algorithm_choice == 'astar' else 'N/A',
-                'd': d,
-                'g': g,
-                '#E': explored,
-                '#F': f,
-            }
-
             with open(output_file, 'a', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=row.keys())
+                writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
                 if write_header:
                     writer.writeheader()
                 writer.writerow(row)
 
             print(f"\nResults saved to {output_path}")
         except Exception as e:
-            print(f"Could not save results to CSV: {e}")
\ No newline at end of file
+            print(f"Could not save results to CSV: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+
+ALGORITHMS = ['bfs', 'dfs', 'astar']
+ASTAR_HEURISTICS = ['h', 'h_chebyshev', 'h_euclidean', 'h_minhardness', 'h_combined']
+
+
+def main():
+    # -------------------------------
+    # 1. Parse command-line arguments
+    # -------------------------------
+    parser = argparse.ArgumentParser(
+        description="Run every algorithm/heuristic combination on a set of maps and write a single CSV."
+    )
+    parser.add_argument(
+        "map_paths",
+        nargs="+",
+        help="Map files to process, in order."
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=str,
+        required=True,
+        help="CSV file where all results are written (overwritten if it exists)."
+    )
+    parser.add_argument(
+        "-a", "--algorithms",
+        nargs="+",
+        default=ALGORITHMS,
+        choices=['bfs', 'dfs', 'astar', 'idastar', 'bidastar'],
+        help=f"Algorithms to run on each map. Default: {' '.join(ALGORITHMS)}"
+    )
+    parser.add_argument(
+        "--heuristics",
+        nargs="+",
+        default=ASTAR_HEURISTICS,
+        help=f"Heuristics to run with the informed algorithms. Default: {' '.join(ASTAR_HEURISTICS)}"
+    )
+
+    args = parser.parse_args()
+
+    from DrillingRobot import DrillingRobot
+    from main import CSV_FIELDS, INFORMED_ALGORITHMS, run_search, result_row
+
+    output_file = Path(args.output)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # -------------------------------
+    # 2. Run every combination, writing through one open CSV
+    # -------------------------------
+    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+
+        for map_path in args.map_paths:
+            print(f"Map: {map_path}")
+            try:
+                problem = DrillingRobot(map_path)
+            except FileNotFoundError:
+                print(f"ERROR: Map file '{map_path}' not found. Please check the path.")
+                sys.exit(1)
+            except Exception as e:
+                print(f"An error occurred while loading the map: {e}")
+                sys.exit(1)
+
+            for algorithm in args.algorithms:
+                heuristics = args.heuristics if algorithm in INFORMED_ALGORITHMS else ['N/A']
+                for heuristic in heuristics:
+                    if algorithm in INFORMED_ALGORITHMS:
+                        print(f"  Running {algorithm} with heuristic: {heuristic} ...")
+                    else:
+                        print(f"  Running {algorithm} ...")
+                    solution_node, exp, frontier, _, _ = run_search(problem, algorithm, heuristic.lower())
+                    writer.writerow(result_row(map_path, algorithm, heuristic.lower(), solution_node, exp, frontier))
+
+    print(f"\nResults saved to {output_file}")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@
 set -e
 
 MAIN_SCRIPT="main.py"
+BATCH_SCRIPT="run_batch.py"
 GEN_SCRIPT="generate_maps.py"
 MAPS_DIR="maps"
 RESULTS_DIR="results"
@@ -35,10 +36,12 @@ echo "Maps generated in '$MAPS_DIR/'"
 echo
 
 # --- Step 2: Check dependencies ---------------------------------------------
-if [ ! -f "$MAIN_SCRIPT" ]; then
-  echo "ERROR: $MAIN_SCRIPT not found."
-  exit 1
-fi
+for SCRIPT in "$MAIN_SCRIPT" "$BATCH_SCRIPT"; do
+  if [ ! -f "$SCRIPT" ]; then
+    echo "ERROR: $SCRIPT not found."
+    exit 1
+  fi
+done
 if [ ! -d "$MAPS_DIR" ]; then
   echo "ERROR: Directory '$MAPS_DIR' not found."
   exit 1
@@ -74,22 +77,10 @@ for SUBDIR in "$MAPS_DIR"/*; do
       continue
     fi
 
-    # Run all algorithms on each map
-    for MAP_FILE in "${MAP_FILES[@]}"; do
-      echo "Map: $MAP_FILE"
-
-      for ALG in "${ALGORITHMS[@]}"; do
-        if [ "$ALG" != "astar" ]; then
-          echo "  Running $ALG ..."
-          python3 "$MAIN_SCRIPT" "$MAP_FILE" -a "$ALG" -o "$CSV_FILE"
-        else
-          for H in "${ASTAR_HEURISTICS[@]}"; do
-            echo "  Running astar with heuristic: $H ..."
-            python3 "$MAIN_SCRIPT" "$MAP_FILE" -a astar --heuristic "$H" -o "$CSV_FILE"
-          done
-        fi
-      done
-    done
+    # Run all algorithms on each map; each map is parsed once and the CSV
+    # is opened once for the whole folder
+    python3 "$BATCH_SCRIPT" "${MAP_FILES[@]}" -o "$CSV_FILE" \
+      -a "${ALGORITHMS[@]}" --heuristics "${ASTAR_HEURISTICS[@]}"
 
     echo "Finished processing: $CSV_FILE"
     echo
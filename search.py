@@ -43,6 +43,33 @@ class Problem:
         """
         return c + 1
 
+    def successors(self, state):
+        """Return (action, next_state, step_cost) triples for every action applicable in `state`.
+
+        The default implementation combines `actions`, `result`, and `path_cost`
+        (assuming additive path costs). Subclasses may override it with a fused,
+        faster version; search nodes expand through this method.
+        """
+        triples = []
+        for action in self.actions(state):
+            next_state = self.result(state, action)
+            triples.append((action, next_state, self.path_cost(0, state, action, next_state)))
+        return triples
+
+    def predecessors(self, state):
+        """Return (action, prev_state, step_cost) triples such that applying `action`
+        in `prev_state` leads to `state` (reverse model, used by bidirectional search)."""
+        raise NotImplementedError
+
+    def goal_states(self):
+        """Return the list of concrete goal states (starting points of a backward search).
+
+        By default, `self.goal` itself, or its elements if it is defined as a list.
+        """
+        if isinstance(self.goal, list):
+            return list(self.goal)
+        return [self.goal]
+
     def value(self, state):
         """Return the value of a state for optimization problems (e.g., hill climbing)."""
         raise NotImplementedError
@@ -64,15 +91,17 @@ class Node:
     with the same state but different path costs or parent references.
     """
 
+    # Fixed attribute layout (no per-node __dict__). `f` and `h` are the slots
+    # filled in by `memoize(..., 'f')` / `memoize(..., 'h')` in the informed searches.
+    __slots__ = ('state', 'parent', 'action', 'path_cost', 'depth', 'expansion_order', 'f', 'h')
+
     def __init__(self, state, parent=None, action=None, path_cost=0):
         """Create a new search tree node derived from a parent via an action."""
         self.state = state
         self.parent = parent
         self.action = action
         self.path_cost = path_cost
-        self.depth = 0
-        if parent:
-            self.depth = parent.depth + 1
+        self.depth = parent.depth + 1 if parent is not None else 0
 
         # Record of the order in which the node was expanded (for tracing)
         self.expansion_order = 0
@@ -85,8 +114,8 @@ class Node:
 
     def expand(self, problem):
         """Return a list of successor nodes reachable from this node in one step."""
-        return [self.child_node(problem, action)
-                for action in problem.actions(self.state)]
+        return [Node(next_state, self, action, self.path_cost + step_cost)
+                for action, next_state, step_cost in problem.successors(self.state)]
 
     def child_node(self, problem, action):
         """Generate a child node by applying an action to the current state."""
@@ -104,7 +133,8 @@ class Node:
         while node:
             path_back.append(node)
             node = node.parent
-        return list(reversed(path_back))
+        path_back.reverse()     # In place: no second list
+        return path_back
 
     # Nodes with the same state are treated as equal for queue management.
     def __eq__(self, other):
@@ -115,19 +145,43 @@ class Node:
         return hash(self.state)
 
 
-def depth_first_graph_search(problem):
+def _seen_table(problem):
+    """
+    Return an empty table of seen states and its membership test.
+
+    Problems with int-encoded states in [0, problem.state_space_size) get a
+    bytearray (one byte per state); any other problem gets a dict. Either way,
+    `table[state] = 1` marks a state and `is_seen(state)` is truthy once marked.
+    """
+    size = getattr(problem, 'state_space_size', None)
+    if size:
+        table = bytearray(size)
+        return table, table.__getitem__
+    table = {}
+    return table, table.get
+
+
+def depth_first_graph_search(problem, trace=False):
     """
     Depth-First Search (DFS) for graph-based problems.
 
+    Parameters
+    ----------
+    problem : Problem
+        Problem instance.
+    trace : bool
+        Record `generated`, `edges` and `node_list_in_order` (only needed to
+        draw the search tree). When False they are returned empty.
+
     Returns
     -------
     (solution, generated, expanded, edges, node_list_in_order, frontier)
         solution : Node or None
             Solution node if the goal is found; None otherwise.
-        generated : set[Node]
-            Set of all generated nodes.
-        expanded : set[Node]
-            Set of expanded nodes (whose successors were explored).
+        generated : set[state]
+            States of all generated nodes.
+        expanded : set[state]
+            States of expanded nodes (whose successors were explored).
         edges : list[tuple(Node, Node)]
             List of (parent, child) edges created.
         node_list_in_order : list[Node]
@@ -137,11 +191,11 @@ def depth_first_graph_search(problem):
     """
     node = Node(problem.initial)
 
-    # Tracking structures
-    expanded = set()
-    generated = {node}
+    # Tracking structures (generated/edges/order only filled when tracing)
+    expanded = set()                  # States already expanded
+    generated = {node.state} if trace else set()
     edges = []
-    node_list_in_order = [node]
+    node_list_in_order = [node] if trace else []
     counter = 1
     node.expansion_order = 0
 
@@ -149,84 +203,85 @@ def depth_first_graph_search(problem):
         return node, generated, expanded, edges, node_list_in_order, []
 
     frontier = [node]                 # Stack
-    frontier_states = {node.state}    # States currently in frontier
-    explored = set()                  # States already expanded
+    # States in the frontier or already expanded (see _seen_table)
+    seen, is_seen = _seen_table(problem)
+    seen[node.state] = 1
+    # Bound methods hoisted out of the loop (one attribute lookup per search)
+    successors, goal_test = problem.successors, problem.goal_test
 
     while frontier:
         node = frontier.pop()
-        frontier_states.remove(node.state)
-
-        if node.state in explored:
-            continue
-        explored.add(node.state)
-        expanded.add(node)
-
-        for child in node.expand(problem):
-            s = child.state
-            if (s not in explored) and (s not in frontier_states):
-                generated.add(child)
-                edges.append((node, child))
-                child.expansion_order = counter
-                counter += 1
-                node_list_in_order.append(child)
-
-                if problem.goal_test(s):
+        # Each state enters the stack at most once (seen table), so popped
+        # states are never already expanded and need no goal test here
+        expanded.add(node.state)
+
+        for action, s, step_cost in successors(node.state):
+            # Build a child node only for states that are new
+            if not is_seen(s):
+                child = Node(s, node, action, node.path_cost + step_cost)
+                if trace:
+                    generated.add(s)
+                    edges.append((node, child))
+                    child.expansion_order = counter
+                    counter += 1
+                    node_list_in_order.append(child)
+
+                if goal_test(s):
                     return child, generated, expanded, edges, node_list_in_order, frontier
 
                 frontier.append(child)
-                frontier_states.add(s)
+                seen[s] = 1
 
     # If no solution is found, return all collected data and the final (empty) frontier
     return None, generated, expanded, edges, node_list_in_order, frontier
 
 
-def breadth_first_graph_search(problem):
+def breadth_first_graph_search(problem, trace=False):
     """Breadth-First Search (BFS) for graph-based problems. [Figure 3.11]
 
-    This version maintains the order of generated nodes (FIFO)
-    for accurate visualization of the search tree.
+    With `trace`, this version maintains the order of generated nodes (FIFO)
+    for accurate visualization of the search tree; otherwise `generated`,
+    `edges` and `node_list_in_order` are returned empty.
     """
     node = Node(problem.initial)
-    node_list_in_order = [node]
+    node_list_in_order = [node] if trace else []
+    generated = {node.state} if trace else set()
 
     if problem.goal_test(node.state):
         # If the initial state is the goal, return immediately.
-        return node, {node}, set(), [], node_list_in_order, frontier
+        return node, generated, set(), [], node_list_in_order, []
 
     frontier = deque([node])
-    explored = set()
-    generated = {node}
-    expanded = set()
+    # States in the frontier or already expanded (see _seen_table)
+    seen, is_seen = _seen_table(problem)
+    seen[node.state] = 1
+    expanded = set()                  # States already expanded
     edges = []
-    expansion_order = {}
-    counter = 1
+    # Bound methods hoisted out of the loop (one attribute lookup per search)
+    successors, goal_test = problem.successors, problem.goal_test
 
     while frontier:
         node = frontier.popleft()
-        expanded.add(node)
-        explored.add(node.state)
-        for child in node.expand(problem):
-
-            # Check if the child is already in the frontier
-            is_in_frontier = any(n.state == child.state for n in frontier)
-
-            if child.state not in explored and not is_in_frontier:
-                generated.add(child)
-                edges.append((node, child))
-                expansion_order[(node, child)] = counter
-                counter += 1
-
-                # Keep nodes in generation order (FIFO)
-                node_list_in_order.append(child)
-
-                if problem.goal_test(child.state):
+        expanded.add(node.state)
+        for action, s, step_cost in successors(node.state):
+            # Build a child node only for states that are new
+            if not is_seen(s):
+                child = Node(s, node, action, node.path_cost + step_cost)
+                if trace:
+                    generated.add(s)
+                    edges.append((node, child))
+                    # Keep nodes in generation order (FIFO)
+                    node_list_in_order.append(child)
+
+                if goal_test(s):
                     return child, generated, expanded, edges, node_list_in_order, frontier
                 frontier.append(child)
+                seen[s] = 1
 
     return None, generated, expanded, edges, node_list_in_order, frontier
 
 
-def best_first_graph_search(problem, f):
+def best_first_graph_search(problem, f, trace=False):
     """
     Best-First Search.
 
@@ -241,6 +296,9 @@ def best_first_graph_search(problem, f):
         Examples:
           - Greedy Best-First: f = lambda n: h(n)
           - A*: f = lambda n: n.path_cost + h(n)
+    trace : bool
+        Record `generated`, `edges` and `node_list_in_order` (only needed to
+        draw the search tree). When False they are returned empty.
 
     Returns
     -------
@@ -249,52 +307,263 @@ def best_first_graph_search(problem, f):
     f = memoize(f, 'f')
     node = Node(problem.initial)
 
-    # Tracking structures
-    expanded = set()
-    generated = {node}
+    # Tracking structures (generated/edges/order only filled when tracing)
+    expanded = set()                  # States already expanded
+    generated = {node.state} if trace else set()
     edges = []
-    node_list_in_order = [node]
+    node_list_in_order = [node] if trace else []
     counter = 1
     node.expansion_order = 0
 
     frontier = PriorityQueue('min', f)
     frontier.append(node)
-    explored = set()
+    # Live frontier node per state. Improved nodes are pushed again and the
+    # replaced heap entries are skipped when popped (lazy deletion), so no
+    # linear scans of the heap are needed.
+    frontier_best = {node.state: node}
+    # Bound methods hoisted out of the loop (one attribute lookup per search)
+    successors, goal_test = problem.successors, problem.goal_test
 
     while frontier:
         node = frontier.pop()
+        if frontier_best.get(node.state) is not node:
+            continue    # Stale entry, superseded by a lower f value
+        del frontier_best[node.state]
+
+        if goal_test(node.state):
+            # Return the live frontier nodes (in insertion order, unsorted)
+            return node, generated, expanded, edges, node_list_in_order, list(frontier_best.values())
+
+        expanded.add(node.state)
+
+        for action, s, step_cost in successors(node.state):
+            # Expanded states are skipped before any node is built
+            if s in expanded:
+                continue
+            child = Node(s, node, action, node.path_cost + step_cost)
+            current = frontier_best.get(s)
+            if current is None:
+                if trace:
+                    generated.add(s)
+                    edges.append((node, child))
+                    child.expansion_order = counter
+                    counter += 1
+                    node_list_in_order.append(child)
+                frontier.append(child)
+                frontier_best[s] = child
+            elif f(child) < f(current):
+                # Update the node if a better (lower) f value is found
+                frontier.append(child)
+                frontier_best[s] = child
+
+    # If no solution is found, return all recorded data
+    return None, generated, expanded, edges, node_list_in_order, list(frontier_best.values())
+
+
+def astar_search(problem, h=None, trace=False):
+    """A* Search: Best-First Search with f(n) = g(n) + h(n).
+
+    The heuristic function h must be provided either when calling this function
+    or as part of the Problem subclass. `trace` is passed to best_first_graph_search.
+    """
+    h = memoize(h or problem.h, 'h')
+    return best_first_graph_search(problem, lambda n: n.path_cost + h(n), trace)
+
 
-        if problem.goal_test(node.state):
-            # Return the frontier as a list sorted by priority
-            return node, generated, expanded, edges, node_list_in_order, [item for _, item in sorted(frontier.heap)]
+def idastar_search(problem, h=None, trace=False):
+    """
+    Iterative Deepening A* (IDA*).
+
+    Repeated depth-first searches bounded by f(n) = g(n) + h(n); each iteration
+    raises the bound to the smallest f value that exceeded it. Only the current
+    path is kept in memory (no priority queue, no explored set); cycles are
+    avoided by skipping states already on the current path. Optimal for an
+    admissible heuristic, but states may be re-expanded across iterations.
 
-        expanded.add(node)
-        explored.add(node.state)
+    Returns
+    -------
+    (solution, generated, expanded, edges, node_list_in_order, frontier)
+        Same layout as the other searches. The tracking structures describe the
+        last iteration (generated/edges/order only with `trace`), and
+        `frontier` is the path being explored at termination.
+    """
+    h = memoize(h or problem.h, 'h')
+    root = Node(problem.initial)
+    bound = root.path_cost + h(root)
+
+    while True:
+        # Tracking structures (reset on every iteration)
+        expanded = set()
+        generated = {root.state} if trace else set()
+        edges = []
+        node_list_in_order = [root] if trace else []
+        counter = 1
+        root.expansion_order = 0
+
+        if problem.goal_test(root.state):
+            return root, generated, expanded, edges, node_list_in_order, []
+
+        next_bound = float('inf')
+        expanded.add(root.state)
+        on_path = {root.state}
+        stack = [(root, iter(root.expand(problem)))]   # Current path with pending children
+
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                on_path.discard(node.state)
+                continue
 
-        for child in node.expand(problem):
             s = child.state
-            if (s not in explored) and (child not in frontier):
-                generated.add(child)
+            if s in on_path:
+                continue
+
+            f = child.path_cost + h(child)
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+
+            if trace:
+                generated.add(s)
                 edges.append((node, child))
                 child.expansion_order = counter
                 counter += 1
                 node_list_in_order.append(child)
-                frontier.append(child)
-            elif child in frontier:
-                # Update the node if a better (lower) f value is found
-                if f(child) < frontier[child]:
-                    del frontier[child]
-                    frontier.append(child)
 
-    # If no solution is found, return all recorded data
-    return None, generated, expanded, edges, node_list_in_order, [item for _, item in sorted(frontier.heap)]
+            if problem.goal_test(s):
+                return child, generated, expanded, edges, node_list_in_order, [n for n, _ in stack]
 
+            expanded.add(s)
+            on_path.add(s)
+            stack.append((child, iter(child.expand(problem))))
 
-def astar_search(problem, h=None):
-    """A* Search: Best-First Search with f(n) = g(n) + h(n).
+        # Nothing exceeded the bound: the reachable space is exhausted
+        if next_bound == float('inf'):
+            return None, generated, expanded, edges, node_list_in_order, []
+        bound = next_bound
 
-    The heuristic function h must be provided either when calling this function
-    or as part of the Problem subclass.
+
+def bidirectional_astar_search(problem, h=None, h_back=None, trace=False):
+    """
+    Bidirectional A* Search.
+
+    Runs one A* search forward from the initial state (guided by `h`) and one
+    backward from the goal states (through `problem.predecessors`, guided by
+    `h_back`, a lower bound on the cost from the initial state), always expanding
+    the side with the smaller frontier. Every time a state is reached from both
+    sides the cheapest joined path (cost mu) is recorded; the search stops once
+    the smallest f value of either frontier reaches mu. Optimal for consistent
+    heuristics.
+
+    Problems without a reverse model (`predecessors` not overridden) fall back
+    to unidirectional A*; without `h_back` or `problem.h_reverse` the backward
+    side is uninformed (h = 0).
+
+    Returns
+    -------
+    (solution, generated, expanded, edges, node_list_in_order, frontier)
+        Same layout as the other searches; the tracking structures (filled
+        only with `trace`) and the frontier cover both directions. The solution is a forward chain of
+        nodes from the initial state to a goal state.
     """
+    if type(problem).predecessors is Problem.predecessors:
+        return astar_search(problem, h, trace)
+
     h = memoize(h or problem.h, 'h')
-    return best_first_graph_search(problem, lambda n: n.path_cost + h(n))
+    h_back = memoize(h_back or getattr(problem, 'h_reverse', None) or (lambda n: 0), 'h')
+    f_fwd = memoize(lambda n: n.path_cost + h(n), 'f')
+    f_back = memoize(lambda n: n.path_cost + h_back(n), 'f')
+
+    root = Node(problem.initial)
+
+    # Tracking structures (shared by both directions)
+    expanded = set()
+    generated = {root.state} if trace else set()
+    edges = []
+    node_list_in_order = [root] if trace else []
+    counter = 1
+    root.expansion_order = 0
+
+    # Per direction: priority queue, best node per state, expanded states
+    frontier_fwd = PriorityQueue('min', f_fwd)
+    frontier_fwd.append(root)
+    best_fwd = {root.state: root}
+    closed_fwd = set()
+
+    frontier_back = PriorityQueue('min', f_back)
+    best_back = {}
+    closed_back = set()
+    for goal in problem.goal_states():
+        node = Node(goal)
+        frontier_back.append(node)
+        best_back[goal] = node
+
+    # Cheapest joined path found so far: its cost and its (forward, backward) halves
+    mu = float('inf')
+    meeting = None
+    if root.state in best_back:
+        mu, meeting = 0, (root, best_back[root.state])
+
+    while frontier_fwd and frontier_back:
+        if max(frontier_fwd.heap[0][0], frontier_back.heap[0][0]) >= mu:
+            break
+
+        forward = len(frontier_fwd) <= len(frontier_back)
+        if forward:
+            frontier, best, closed, other_best = frontier_fwd, best_fwd, closed_fwd, best_back
+        else:
+            frontier, best, closed, other_best = frontier_back, best_back, closed_back, best_fwd
+
+        node = frontier.pop()
+        if node.state in closed or best[node.state] is not node:
+            continue    # Stale entry: a cheaper node for this state was queued later
+
+        expanded.add(node.state)
+        closed.add(node.state)
+
+        if forward:
+            children = node.expand(problem)
+        else:
+            children = [Node(prev_state, node, action, node.path_cost + step_cost)
+                        for action, prev_state, step_cost in problem.predecessors(node.state)]
+
+        for child in children:
+            s = child.state
+            if s in closed:
+                continue
+            old = best.get(s)
+            if old is not None and old.path_cost <= child.path_cost:
+                continue
+
+            best[s] = child
+            frontier.append(child)
+            if trace:
+                generated.add(s)
+                edges.append((node, child))
+                child.expansion_order = counter
+                counter += 1
+                node_list_in_order.append(child)
+
+            other = other_best.get(s)
+            if other is not None and child.path_cost + other.path_cost < mu:
+                mu = child.path_cost + other.path_cost
+                meeting = (child, other) if forward else (other, child)
+
+    # Live entries of both frontiers (unsorted)
+    frontier = [item for s, item in best_fwd.items() if s not in closed_fwd]
+    frontier += [item for s, item in best_back.items() if s not in closed_back]
+
+    if not meeting:
+        return None, generated, expanded, edges, node_list_in_order, frontier
+
+    # Join the halves: replay the backward chain as forward nodes
+    node, back = meeting
+    while back.parent is not None:
+        nxt = back.parent
+        node = Node(nxt.state, node, back.action, node.path_cost + back.path_cost - nxt.path_cost)
+        h(node)
+        back = nxt
+
+    return node, generated, expanded, edges, node_list_in_order, frontier
@@ -1,105 +1,173 @@
-from graphviz import Digraph
-from collections import defaultdict
-from typing import Iterable, List, Tuple, Optional, Any, Set
+from concurrent.futures import Executor, Future
+from typing import Callable, Iterable, List, Tuple, Optional, Any
 import argparse
 import os
+import subprocess
+import sys
 
-# Import search components
-from DrillingRobot import DrillingRobot
-from search import breadth_first_graph_search, depth_first_graph_search, astar_search
+from drilling_utils import ACTION_NAMES
 
+# Node fill colors, indexed by category: generated, expanded, solution path
+FILL_COLORS = ("lightblue", "lightcoral", "lightgreen")
 
-def visualize_tree(
+# Start of the DOT source: graph, node and edge attributes
+DOT_HEADER = """// Search Tree
+digraph {
+\tgraph [concentrate=false dpi=150 nodesep=0.7 overlap=false rankdir=TB ranksep=1.5 splines=polyline]
+\tnode [fixedsize=true fontsize=12 height=0.9 shape=box style=filled width=2.2]
+\tedge [fontsize=13 labelangle=-20 labeldistance=2.5 labelfloat=true]
+"""
+
+# Escapes double quotes inside quoted DOT strings
+_DOT_ESCAPE = str.maketrans({'"': '\\"'})
+
+
+def tree_to_dot(
     gen: Iterable[Any],
     exp: Iterable[Any],
     edges: Iterable[Tuple[Any, Any]],
     node_list_in_order: Iterable[Any],
-    filename: str,
     solution_node: Optional[Any] = None,
-) -> None:
+    format_state: Optional[Callable[[Any], Any]] = None,
+    max_depth: Optional[int] = None,
+) -> Tuple[str, int]:
     """
-    Render a search tree/graph as a layered diagram using Graphviz.
+    Build the Graphviz DOT source of a search tree/graph (layered diagram).
+
+    Returns (source, skipped): the DOT text and the number of nodes left out
+    by `max_depth` (0 without a cap). Nothing is printed.
 
     Coloring:
         lightgreen = nodes in the solution path
         lightcoral = expanded nodes
         lightblue = generated nodes (not expanded)
-    """
 
-    # Map each state to its Node object
-    state_to_node = {n.state: n for n in gen}
-
-    dot = Digraph(
-        comment="Search Tree",
-        graph_attr={
-            "rankdir": "TB",
-            "splines": "polyline",
-            "overlap": "false",
-            "dpi": "150",
-            "ranksep": "1.5",
-            "nodesep": "0.7",
-            "concentrate": "false",
-        },
-        node_attr={
-            "shape": "box",
-            "width": "2.2",
-            "height": "0.9",
-            "fixedsize": "true",
-            "style": "filled",
-            "fontsize": "12",
-        },
-        edge_attr={
-            "fontsize": "13",
-            "labelfloat": "true",
-            "labeldistance": "2.5",
-            "labelangle": "-20",
-        },
-    )
+    `format_state` maps a state to what is shown for it (e.g.
+    `DrillingRobot.decode_state` for packed int states); default: the state itself.
 
-    # Identify sets of states
-    solution_states: Set[Any] = set()
-    if solution_node is not None and hasattr(solution_node, "path"):
-        try:
-            solution_states = {n.state for n in solution_node.path()}
-        except Exception:
-            solution_states = set()
-
-    expanded_states = {n.state for n in exp}
-    ordered_depth_groups = defaultdict(list)
-
-    # Add nodes
-    for item in node_list_in_order:
-        node_state = getattr(item, "state", item)
-        node = state_to_node.get(node_state)
-        if node is None:
-            continue
+    `max_depth` caps the drawn tree: nodes deeper than it (and their edges) are
+    left out, except those on the solution path.
+    """
+    def state_key(s):
+        return str(format_state(s) if format_state else s).translate(_DOT_ESCAPE)
 
-        if node_state in solution_states:
-            fill = "lightgreen"
-        elif node_state in expanded_states:
-            fill = "lightcoral"
-        else:
-            fill = "lightblue"
+    # Only the solution path needs a set of its own; `gen` and `exp` (states)
+    # are used as given when they are already sets
+    gen = gen if isinstance(gen, (set, frozenset)) else set(gen)
+    exp = exp if isinstance(exp, (set, frozenset)) else set(exp)
+    # Solution states, collected straight from the parent chain (no path list)
+    solution_states = set()
+    n = solution_node
+    while n is not None:
+        solution_states.add(n.state)
+        n = getattr(n, "parent", None)
 
-        expansion_order = getattr(node, "expansion_order", "?")
-        depth = getattr(node, "depth", "?")
-        path_cost = getattr(node, "path_cost", 0.0)
-        label = f"#{expansion_order}\nS: {node.state}\nd: {depth}\ng(n): {path_cost:.1f}"
+    # DOT source lines (same layout as the graphviz package would produce,
+    # without building its intermediate objects), joined once at the end
+    lines = [DOT_HEADER]
+    add_line = lines.append
 
-        node_key = str(node.state)
-        dot.node(node_key, label=label, fillcolor=fill)
-        ordered_depth_groups[depth].append(node_key)
+    # Add nodes: one pass that classifies and emits every generated state,
+    # represented by its first node in `node_list_in_order`
+    # (colors: 0 = generated, 1 = expanded, 2 = solution)
+    node_keys = {}      # state -> DOT node key
+    skipped = set()     # States left out by `max_depth`
+    for node in node_list_in_order:
+        s = node.state
+        if s in node_keys or s not in gen:
+            continue
+        if max_depth is not None and node.depth > max_depth and s not in solution_states:
+            skipped.add(s)
+            continue
+        node_key = node_keys[s] = state_key(s)
+        color = 2 if s in solution_states else 1 if s in exp else 0
+        fill = FILL_COLORS[color]
+
+        # search.Node declares all three as slots; other node types may not
+        try:
+            expansion_order, depth, path_cost = node.expansion_order, node.depth, node.path_cost
+        except AttributeError:
+            expansion_order = depth = "?"
+            path_cost = 0.0
+        # Node line and label built by one f-string
+        add_line(
+            f'\t"{node_key}" [label="#{expansion_order}\nS: {node_key}\nd: {depth}'
+            f'\ng(n): {path_cost:.1f}" fillcolor={fill}]\n'
+        )
 
     # Add edges
+    drawn_edges = set()
     for parent, child in edges:
         p_state = getattr(parent, "state", parent)
         c_state = getattr(child, "state", child)
+        if p_state in skipped or c_state in skipped:
+            continue
         action = getattr(child, "action", None)
-        dot.edge(str(p_state), str(c_state), label=str(action) if action else "")
+        # Endpoints that were not drawn as nodes get their key formatted once too
+        p_key = node_keys.get(p_state)
+        if p_key is None:
+            p_key = node_keys[p_state] = state_key(p_state)
+        c_key = node_keys.get(c_state)
+        if c_key is None:
+            c_key = node_keys[c_state] = state_key(c_state)
+        edge_label = ACTION_NAMES[action] if action is not None else '""'
+
+        # The same parent -> child step can be recorded more than once (e.g. by
+        # IDA*, which re-expands states); draw it only once
+        edge = (p_key, c_key, edge_label)
+        if edge in drawn_edges:
+            continue
+        drawn_edges.add(edge)
+        add_line(f'\t"{p_key}" -> "{c_key}" [label={edge_label}]\n')
+
+    add_line("}\n")
+
+    return "".join(lines), len(skipped)
+
+
+def render_dot(source: str, filename: str, format: str = "svg") -> None:
+    """
+    Render DOT source to `<filename>.<format>` with the Graphviz `dot`
+    executable (which must be on PATH), piping the source through stdin.
+
+    SVG (the default) skips rasterization, which dominates for large trees.
+    """
+    try:
+        subprocess.run(["dot", f"-T{format}", "-o", f"{filename}.{format}"], input=source, text=True, check=True)
+    except FileNotFoundError:
+        raise RuntimeError("Graphviz 'dot' executable not found. Install Graphviz (see README).") from None
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Graphviz 'dot' failed with exit code {e.returncode}.") from None
+    print(f"Search tree saved to {filename}.{format}")
 
-    # Render
-    dot.render(filename, format="png", cleanup=True)
-    print(f"Search tree saved to {filename}.png")
+
+def visualize_tree(
+    gen: Iterable[Any],
+    exp: Iterable[Any],
+    edges: Iterable[Tuple[Any, Any]],
+    node_list_in_order: Iterable[Any],
+    filename: str,
+    solution_node: Optional[Any] = None,
+    format_state: Optional[Callable[[Any], Any]] = None,
+    max_depth: Optional[int] = None,
+    format: str = "svg",
+    executor: Optional[Executor] = None,
+) -> Optional[Future]:
+    """
+    Render a search tree/graph as a layered diagram using Graphviz
+    (`tree_to_dot` + `render_dot`).
+
+    With an `executor` (e.g. a ThreadPoolExecutor), the `dot` call is submitted
+    to it and its Future is returned, so the caller can build the next tree
+    while Graphviz lays out this one. Otherwise it renders before returning.
+    """
+    source, skipped = tree_to_dot(gen, exp, edges, node_list_in_order, solution_node, format_state, max_depth)
+    if skipped:
+        print(f"Skipped {skipped} nodes deeper than max depth {max_depth}.")
+    if executor is not None:
+        return executor.submit(render_dot, source, filename, format)
+    render_dot(source, filename, format)
+    return None
 
 
 if __name__ == "__main__":
@@ -130,12 +198,29 @@ if __name__ == "__main__":
     parser.add_argument(
         "--heuristic",
         type=str,
-        default="default",
-        help="Heuristic function to use with A* (optional)."
+        default="h_combined",
+        help="Heuristic function to use with A* (optional). Default: h_combined"
+    )
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=None,
+        help="Only draw nodes up to this depth, plus the solution path (optional). Default: no limit"
+    )
+    parser.add_argument(
+        "-f", "--format",
+        type=str,
+        default="svg",
+        choices=["svg", "png", "pdf"],
+        help="Image format of the output file (optional). Default: svg"
     )
 
     args = parser.parse_args()
 
+    # Import search components (NumPy via DrillingRobot) once the arguments are valid
+    from DrillingRobot import DrillingRobot
+    from search import breadth_first_graph_search, depth_first_graph_search, astar_search
+
     # ---------------------------------
     # Problem initialization
     # ---------------------------------
@@ -146,7 +231,7 @@ if __name__ == "__main__":
 
     if not os.path.exists(map_path):
         print(f"ERROR: Map file '{map_path}' not found.")
-        exit(1)
+        sys.exit(1)
 
     print(f"Loading problem from {map_path} ...")
     problem = DrillingRobot(map_path)
@@ -156,27 +241,26 @@ if __name__ == "__main__":
     # ---------------------------------
     print(f"Running algorithm: {algorithm.upper()}")
 
-    if algorithm == "bfs":
-        sol, gen, exp, edges, order, frontier = breadth_first_graph_search(problem)
-    elif algorithm == "dfs":
-        sol, gen, exp, edges, order, frontier = depth_first_graph_search(problem)
-    elif algorithm == "astar":
-        if heuristic == "default":
-            sol, gen, exp, edges, order, frontier = astar_search(problem)
-        elif hasattr(problem, heuristic):
-            heuristic_func = getattr(problem, heuristic)
-            sol, gen, exp, edges, order, frontier = astar_search(problem, h=heuristic_func)
-        else:
+    search_funcs = {
+        "bfs": breadth_first_graph_search,
+        "dfs": depth_first_graph_search,
+        "astar": astar_search,
+    }
+    search_kwargs = {"trace": True}
+    if algorithm == "astar" and heuristic != "default":
+        heuristic_func = getattr(problem, heuristic, None)
+        if heuristic_func is None:
             print(f"Warning: Heuristic '{heuristic}' not found. Using default.")
-            sol, gen, exp, edges, order, frontier = astar_search(problem)
-    else:
-        print("Invalid algorithm.")
-        exit(1)
+        else:
+            search_kwargs["h"] = heuristic_func
+
+    sol, gen, exp, edges, order, frontier = search_funcs[algorithm](problem, **search_kwargs)
 
     # ---------------------------------
     # Draw search tree
     # ---------------------------------
     print(f"Generating search tree image for {algorithm.upper()} ...")
-    visualize_tree(gen, exp, edges, order, output_name, sol)
+    visualize_tree(gen, exp, edges, order, output_name, sol, format_state=problem.decode_state,
+                   max_depth=args.max_depth, format=args.format)
 
     print("Done.")